@@ -1,13 +1,28 @@
+import asyncio
+import socket
+import statistics
 import subprocess
+import sys
 import time
 from pathlib import Path
+from typing import Callable
 
 import httpx
 
+try:
+    import rust_httpx
+except ImportError:
+    rust_httpx = None
+
 SERVER_CMD = ["go", "run", "benchmarks/server.go"]
+PYTHON_CLIENT = Path("benchmarks/python_client.py")
 RUST_CLIENT_MANIFEST = Path("benchmarks/rust-client/Cargo.toml")
 RUST_BINARY = Path("benchmarks/rust-client/target/release/rust-client")
+SERVER_ADDRESS = ("localhost", 8000)
 URL = "http://localhost:8000/"
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+TRIALS = 5
+WARMUP = 1
 
 
 def start_server():
@@ -21,46 +36,95 @@ def start_server():
 def wait_for_server(timeout: float = 5.0) -> None:
     start = time.time()
     while time.time() - start < timeout:
-        try:
-            httpx.get(URL)
-            return
-        except httpx.HTTPError:
-            time.sleep(0.1)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            try:
+                sock.connect(SERVER_ADDRESS)
+                return
+            except OSError:
+                pass
+        time.sleep(0.01)
     raise RuntimeError("Server did not start in time")
 
 
-def benchmark_python(requests: int) -> float:
-    with httpx.Client() as client:
-        start = time.perf_counter()
-        for _ in range(requests):
-            r = client.get(URL)
-            r.raise_for_status()
-        end = time.perf_counter()
-    return end - start
-
-
-def benchmark_rust(requests: int) -> float:
+def build_rust_client() -> None:
     if not RUST_BINARY.exists():
         subprocess.check_call(
             ["cargo", "build", "--release", "--manifest-path", str(RUST_CLIENT_MANIFEST)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-    result = subprocess.check_output([str(RUST_BINARY), str(requests)])
+
+
+def median_time(benchmark: Callable[[], float], trials: int = TRIALS) -> float:
+    return statistics.median(benchmark() for _ in range(trials))
+
+
+def benchmark_python(requests: int) -> float:
+    result = subprocess.check_output(
+        [sys.executable, str(PYTHON_CLIENT), str(requests), "--warmup", str(WARMUP)]
+    )
+    return float(result.strip())
+
+
+async def _gather_gets(client: httpx.AsyncClient, requests: int) -> float:
+    # Warm up with a concurrent batch the size of the pool so every connection
+    # is already open when timing starts, not just the first one
+    for _ in range(WARMUP):
+        warmup = await asyncio.gather(*[client.get(URL) for _ in range(LIMITS.max_connections)])
+        for r in warmup:
+            r.raise_for_status()
+    start = time.perf_counter()
+    responses = await asyncio.gather(*[client.get(URL) for _ in range(requests)])
+    end = time.perf_counter()
+    for r in responses:
+        r.raise_for_status()
+    return end - start
+
+
+async def benchmark_python_async(requests: int) -> float:
+    async with httpx.AsyncClient(limits=LIMITS) as client:
+        return await _gather_gets(client, requests)
+
+
+async def benchmark_rust_async(requests: int) -> float:
+    transport = rust_httpx.AsyncTransport(
+        max_connections=LIMITS.max_connections,
+        max_keepalive_connections=LIMITS.max_keepalive_connections,
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await _gather_gets(client, requests)
+
+
+def benchmark_rust(requests: int) -> float:
+    result = subprocess.check_output([str(RUST_BINARY), str(requests), "--warmup", str(WARMUP)])
     return float(result.strip())
 
 
 def main():
     requests = 1000
+    build_rust_client()
     server = start_server()
     try:
         wait_for_server()
-        py_time = benchmark_python(requests)
-        rust_time = benchmark_rust(requests)
+        print(f"Median of {TRIALS} trials, {requests} requests each")
+        py_time = median_time(lambda: benchmark_python(requests))
+        rust_time = median_time(lambda: benchmark_rust(requests))
         speedup = py_time / rust_time
+        print("Sequential:")
         print(f"Python transport: {py_time:.4f}s")
         print(f"Rust transport: {rust_time:.4f}s")
         print(f"Speedup: {speedup:.2f}x")
+
+        py_async_time = median_time(lambda: asyncio.run(benchmark_python_async(requests)))
+        print("Concurrent:")
+        print(f"Python transport: {py_async_time:.4f}s")
+        if rust_httpx is not None and rust_httpx.is_available():
+            rust_async_time = median_time(lambda: asyncio.run(benchmark_rust_async(requests)))
+            print(f"Rust transport: {rust_async_time:.4f}s")
+            print(f"Speedup: {py_async_time / rust_async_time:.2f}x")
+        else:
+            print("Rust transport: skipped (rust_httpx not installed)")
     finally:
         server.terminate()
         server.wait()
@@ -0,0 +1,27 @@
+import argparse
+import time
+
+import httpx
+
+URL = "http://localhost:8000/"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("requests", type=int, nargs="?", default=1000)
+    parser.add_argument("--warmup", type=int, default=0)
+    args = parser.parse_args()
+
+    with httpx.Client() as client:
+        for _ in range(args.warmup):
+            client.get(URL).raise_for_status()
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            r = client.get(URL)
+            r.raise_for_status()
+        end = time.perf_counter()
+    print(end - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,22 @@ use std::time::Instant;
 #[tokio::main]
 async fn main() {
     let args: Vec<String> = std::env::args().collect();
-    let iterations: usize = args.get(1).and_then(|s| s.parse().ok()).unwrap_or(1000);
+    let mut iterations: usize = 1000;
+    let mut warmup: usize = 0;
+    let mut rest = args.iter().skip(1);
+    while let Some(arg) = rest.next() {
+        if arg == "--warmup" {
+            warmup = rest.next().and_then(|s| s.parse().ok()).unwrap_or(warmup);
+        } else if let Ok(n) = arg.parse() {
+            iterations = n;
+        }
+    }
     let client = reqwest::Client::new();
     let url = "http://localhost:8000/";
+    for _ in 0..warmup {
+        let resp = client.get(url).send().await.unwrap();
+        resp.bytes().await.unwrap();
+    }
     let start = Instant::now();
     for _ in 0..iterations {
         let resp = client.get(url).send().await.unwrap();
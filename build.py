@@ -6,47 +6,80 @@ Simple build script for rust-httpx-transport development.
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def run_command(cmd, cwd=None):
-    """Run a command and return True if successful."""
-    print(f"Running: {' '.join(cmd)}")
+    """Run a command, streaming its output, and return True if successful."""
+    command = ' '.join(cmd)
+    print(f"Running: {command}")
     try:
-        result = subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
+        process = subprocess.Popen(
+            cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        )
+    except OSError as e:
+        print(f"Error running command '{command}': {e}")
         return False
+    
+    with process:
+        for line in process.stdout:
+            print(line, end="")
+    
+    if process.returncode != 0:
+        print(f"Error running command '{command}': exited with status {process.returncode}")
+        return False
+    return True
+
+def _probe(cmd):
+    """Run a short command with captured output and return (ok, report lines)."""
+    command = ' '.join(cmd)
+    report = [f"Running: {command}"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        report.append(f"Error running command '{command}': {e}")
+        return False, report
+    
+    output = (result.stdout + result.stderr).rstrip()
+    if output:
+        report.append(output)
+    if result.returncode != 0:
+        report.append(f"Error running command '{command}': exited with status {result.returncode}")
+        return False, report
+    return True, report
 
 def check_dependencies():
     """Check if required tools are installed."""
     print("Checking dependencies...")
     
-    # Check for Python
-    if not run_command([sys.executable, "--version"]):
-        print("Python is required but not found")
-        return False
-    
-    # Check for uv
-    if not run_command(["uv", "--version"]):
-        print("uv is required but not found")
-        print("Install uv from: https://docs.astral.sh/uv/getting-started/installation/")
-        return False
-    
-    # Check for Rust
-    if not run_command(["rustc", "--version"]):
-        print("Rust is required but not found")
-        print("Install Rust from: https://rustup.rs/")
-        return False
+    # (requirement, probe command, install hint)
+    probes = [
+        ("Python", [sys.executable, "--version"], None),
+        ("uv", ["uv", "--version"], "Install uv from: https://docs.astral.sh/uv/getting-started/installation/"),
+        ("Rust", ["rustc", "--version"], "Install Rust from: https://rustup.rs/"),
+    ]
+    
+    # Run all probes at once; process spawn dominates each one. Output is
+    # captured and printed in order afterwards so it doesn't interleave.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pending = [(name, hint, pool.submit(_probe, cmd)) for name, cmd, hint in probes]
+        maturin_probe = pool.submit(_probe, ["uv", "pip", "show", "maturin"])
+        results = [(name, hint, *future.result()) for name, hint, future in pending]
+        maturin_found, maturin_report = maturin_probe.result()
+    
+    for _, _, _, report in results:
+        print("\n".join(report))
+    print("\n".join(maturin_report))
+    
+    for name, hint, ok, _ in results:
+        if not ok:
+            print(f"{name} is required but not found")
+            if hint:
+                print(hint)
+            return False
     
     # Check for maturin
-    if not run_command(["uv", "pip", "show", "maturin"]):
+    if not maturin_found:
         print("Maturin is required but not found")
         print("Installing maturin...")
         if not run_command(["uv", "pip", "install", "maturin"]):
@@ -100,12 +133,16 @@ def clean():
     # Clean Rust artifacts
     run_command(["cargo", "clean"])
     
-    # Clean Python artifacts
+    # Clean Python artifacts in a single pass over the top-level entries
     import shutil
-    for pattern in ["build", "dist", "*.egg-info"]:
-        for path in Path(".").glob(pattern):
-            if path.is_dir():
-                shutil.rmtree(path)
+    from fnmatch import fnmatch
+    patterns = ["build", "dist", "*.egg-info"]
+    for path in Path(".").iterdir():
+        if path.is_dir() and any(fnmatch(path.name, pattern) for pattern in patterns):
+            shutil.rmtree(path, ignore_errors=True)
+            if path.exists():
+                print(f"Could not fully remove {path}")
+            else:
                 print(f"Removed {path}")
 
 def main():
@@ -6,12 +6,17 @@ reqwest library with tokio and hyper for improved performance.
 """
 
 import sys
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Awaitable, Dict, Final, Iterator, Optional, Union, TYPE_CHECKING
+
+import httpx
 
 if TYPE_CHECKING:
-    import httpx
     import httpcore
 
+# The transports read _RUST_AVAILABLE at construction time rather than binding it
+# once (as a default argument or by swapping in stub classes) so the fallback path
+# can still be exercised by patching it; a module global lookup is already cheap.
+# is_available() and get_version_info() report the state fixed at import time.
 try:
     from ._rust_httpx import AsyncTransport as _AsyncTransport, SyncTransport as _SyncTransport
     from ._rust_httpx import __version__
@@ -25,6 +30,61 @@ except ImportError as e:
     # Fallback version
     __version__ = "0.1.0"
 
+IS_AVAILABLE: Final = _RUST_AVAILABLE
+
+_VERSION_INFO: Final[Dict[str, Any]] = {
+    "version": __version__,
+    "rust_available": _RUST_AVAILABLE,
+    "import_error": str(_IMPORT_ERROR) if not _RUST_AVAILABLE else None,
+    "python_version": sys.version_info,
+}
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    """Expose an httpcore response stream as an httpx sync byte stream."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+
+
+class _AsyncResponseStream(httpx.AsyncByteStream):
+    """Expose an httpcore response stream as an httpx async byte stream."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+def _to_httpx_response(
+    response: "httpcore.Response", stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream]
+) -> httpx.Response:
+    """Wrap the extension's httpcore response the way httpx's own transports do."""
+    return httpx.Response(
+        status_code=response.status,
+        headers=response.headers,
+        stream=stream,
+        extensions=response.extensions,
+    )
+
+
+async def _to_httpx_response_async(pending: "Awaitable[httpcore.Response]") -> httpx.Response:
+    response = await pending
+    return _to_httpx_response(response, _AsyncResponseStream(response.stream))
+
 
 class AsyncTransport:
     """
@@ -39,34 +99,56 @@ class AsyncTransport:
         
         async with httpx.AsyncClient(transport=rust_httpx.AsyncTransport()) as client:
             response = await client.get("https://api.example.com/data")
+    
+    Args:
+        max_connections: Maximum number of concurrent in-flight requests.
+        max_keepalive_connections: Maximum number of idle connections kept per host.
+        keepalive_expiry: Seconds an idle connection is kept in the pool.
+        http2: Whether to negotiate HTTP/2 via ALPN. When False, only HTTP/1.1 is used.
+        timeout: Client-wide request timeout in seconds. None keeps the 30 second default.
+    
+    Unlike httpx's ``Limits``, ``max_connections`` caps in-flight requests rather than
+    open connections, and ``max_keepalive_connections`` applies per host.
     """
     
-    def __init__(self, **kwargs: Any) -> None:
+    __slots__ = ("_transport",)
+    
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 90.0,
+        http2: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
         if not _RUST_AVAILABLE:
             raise ImportError(
                 f"Rust extension not available. Please ensure the rust-httpx-transport "
                 f"package is properly installed. Original error: {_IMPORT_ERROR}"
             )
         
-        self._transport = _AsyncTransport()
+        self._transport = _AsyncTransport(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            timeout=timeout,
+        )
     
-    async def handle_async_request(self, request: "httpcore.Request") -> "httpcore.Response":
-        """Handle an async HTTP request."""
-        if not isinstance(request.url, (str, bytes)) or not isinstance(request.method, str):
-            import httpcore
-
-            method = (
-                request.method.decode() if isinstance(request.method, (bytes, bytearray)) else request.method
-            )
+    def handle_async_request(
+        self, request: "Union[httpx.Request, httpcore.Request]"
+    ) -> "Awaitable[Union[httpx.Response, httpcore.Response]]":
+        """Handle an async HTTP request.
 
-            request = httpcore.Request(
-                method=method,
-                url=str(request.url),
-                headers=[],
-                content=request.stream,
-                extensions=request.extensions,
-            )
-        return await self._transport.handle_async_request(request)
+        httpx requests get an ``httpx.Response``, as ``httpx.AsyncClient``
+        requires; httpcore requests get the extension's awaitable directly,
+        without wrapping it in another coroutine.
+        """
+        pending = self._transport.handle_async_request(request)
+        if isinstance(request, httpx.Request):
+            return _to_httpx_response_async(pending)
+        return pending
     
     async def aclose(self) -> None:
         """Close the transport and clean up resources."""
@@ -95,34 +177,47 @@ class SyncTransport:
         
         with httpx.Client(transport=rust_httpx.SyncTransport()) as client:
             response = client.get("https://api.example.com/data")
+    
+    Accepts the same pool and protocol options as AsyncTransport.
     """
     
-    def __init__(self, **kwargs: Any) -> None:
+    __slots__ = ("_transport",)
+    
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 90.0,
+        http2: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
         if not _RUST_AVAILABLE:
             raise ImportError(
                 f"Rust extension not available. Please ensure the rust-httpx-transport "
                 f"package is properly installed. Original error: {_IMPORT_ERROR}"
             )
         
-        self._transport = _SyncTransport()
+        self._transport = _SyncTransport(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            timeout=timeout,
+        )
     
-    def handle_request(self, request: "httpcore.Request") -> "httpcore.Response":
-        """Handle a sync HTTP request."""
-        if not isinstance(request.url, (str, bytes)) or not isinstance(request.method, str):
-            import httpcore
-
-            method = (
-                request.method.decode() if isinstance(request.method, (bytes, bytearray)) else request.method
-            )
+    def handle_request(
+        self, request: "Union[httpx.Request, httpcore.Request]"
+    ) -> "Union[httpx.Response, httpcore.Response]":
+        """Handle a sync HTTP request.
 
-            request = httpcore.Request(
-                method=method,
-                url=str(request.url),
-                headers=[],
-                content=request.stream,
-                extensions=request.extensions,
-            )
-        return self._transport.handle_request(request)
+        httpx requests get an ``httpx.Response``, as ``httpx.Client`` requires;
+        httpcore requests get the extension's ``httpcore.Response``.
+        """
+        response = self._transport.handle_request(request)
+        if isinstance(request, httpx.Request):
+            return _to_httpx_response(response, _ResponseStream(response.stream))
+        return response
     
     def close(self) -> None:
         """Close the transport and clean up resources."""
@@ -139,24 +234,24 @@ class SyncTransport:
 
 
 def is_available() -> bool:
-    """Check if the Rust transport is available."""
-    return _RUST_AVAILABLE
+    """Check if the Rust transport is available.
+
+    The result is fixed at import time; patching ``_RUST_AVAILABLE`` afterwards
+    does not change it.
+    """
+    return IS_AVAILABLE
 
 
-def get_version_info() -> dict[str, Any]:
+def get_version_info() -> Dict[str, Any]:
     """Get version and availability information."""
-    return {
-        "version": __version__,
-        "rust_available": _RUST_AVAILABLE,
-        "import_error": str(_IMPORT_ERROR) if not _RUST_AVAILABLE else None,
-        "python_version": sys.version_info,
-    }
+    return _VERSION_INFO.copy()
 
 
 # Export the main classes and functions
 __all__ = [
     "AsyncTransport",
     "SyncTransport", 
+    "IS_AVAILABLE",
     "is_available",
     "get_version_info",
     "__version__",
@@ -2,16 +2,26 @@ use std::sync::Arc;
 use std::time::Duration;
 
 use once_cell::sync::OnceCell;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::prelude::*;
+use tokio::sync::Semaphore;
 use reqwest_middleware::{ClientBuilder, ClientWithMiddleware};
 
 static CLIENT: OnceCell<Arc<ClientWithMiddleware>> = OnceCell::new();
 
+/// Interval for HTTP/2 PING frames that keep idle multiplexed connections alive
+const HTTP2_KEEP_ALIVE_INTERVAL: Duration = Duration::from_secs(30);
+
 /// Configuration for the HTTP client
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq)]
 pub struct ClientConfig {
     pub timeout: Duration,
+    /// Cap on concurrent in-flight requests, enforced by the transport's semaphore
+    pub max_connections: usize,
+    /// Idle connections reqwest keeps per host; there is no global connection cap
     pub pool_max_idle_per_host: usize,
     pub pool_idle_timeout: Duration,
+    pub http2: bool,
     pub retries_max_attempts: u32,
     pub user_agent: String,
 }
@@ -20,31 +30,97 @@ impl Default for ClientConfig {
     fn default() -> Self {
         Self {
             timeout: Duration::from_secs(30),
-            pool_max_idle_per_host: 64,
+            max_connections: 100,
+            pool_max_idle_per_host: 20,
             pool_idle_timeout: Duration::from_secs(90),
+            http2: true,
             retries_max_attempts: 3,
             user_agent: format!("rust-httpx-transport/{}", env!("CARGO_PKG_VERSION")),
         }
     }
 }
 
+impl ClientConfig {
+    /// Build a configuration from the transport constructor arguments
+    pub fn from_options(
+        max_connections: usize,
+        max_keepalive_connections: usize,
+        keepalive_expiry: f64,
+        http2: bool,
+        timeout: Option<f64>,
+    ) -> PyResult<Self> {
+        if max_connections == 0 {
+            return Err(PyValueError::new_err("max_connections must be at least 1"));
+        }
+        if max_connections > Semaphore::MAX_PERMITS {
+            return Err(PyValueError::new_err(format!(
+                "max_connections must be at most {}", Semaphore::MAX_PERMITS
+            )));
+        }
+        
+        let mut config = Self {
+            max_connections,
+            pool_max_idle_per_host: max_keepalive_connections,
+            pool_idle_timeout: duration_from_secs("keepalive_expiry", keepalive_expiry)?,
+            http2,
+            ..Self::default()
+        };
+        
+        if let Some(seconds) = timeout {
+            config.timeout = duration_from_secs("timeout", seconds)?;
+        }
+        
+        Ok(config)
+    }
+}
+
+/// Convert a non-negative number of seconds from Python into a Duration
+fn duration_from_secs(name: &str, seconds: f64) -> PyResult<Duration> {
+    if !seconds.is_finite() || seconds < 0.0 {
+        return Err(PyValueError::new_err(format!("{} must be a non-negative number of seconds", name)));
+    }
+    Ok(Duration::from_secs_f64(seconds))
+}
+
 /// Get or create the singleton HTTP client
 pub fn get_client() -> Arc<ClientWithMiddleware> {
     CLIENT.get_or_init(|| {
-        create_client(ClientConfig::default())
+        create_client(&ClientConfig::default())
     }).clone()
 }
 
+/// Get an HTTP client for the given configuration.
+///
+/// The default configuration shares the singleton client; anything else
+/// gets its own connection pool.
+pub fn get_client_for(config: &ClientConfig) -> Arc<ClientWithMiddleware> {
+    if *config == ClientConfig::default() {
+        get_client()
+    } else {
+        create_client(config)
+    }
+}
+
 /// Create a new HTTP client with middleware stack
-fn create_client(config: ClientConfig) -> Arc<ClientWithMiddleware> {
+fn create_client(config: &ClientConfig) -> Arc<ClientWithMiddleware> {
     // Build the base reqwest client
-    let base_client = reqwest::Client::builder()
+    let mut builder = reqwest::Client::builder()
         .timeout(config.timeout)
         .pool_max_idle_per_host(config.pool_max_idle_per_host)
         .pool_idle_timeout(config.pool_idle_timeout)
-        .user_agent(config.user_agent)
-        .http2_prior_knowledge()
-        .use_rustls_tls()
+        .user_agent(config.user_agent.clone())
+        .use_rustls_tls();
+    
+    // HTTP/2 is negotiated via ALPN, so plain HTTP/1.1 servers keep working
+    builder = if config.http2 {
+        builder
+            .http2_adaptive_window(true)
+            .http2_keep_alive_interval(HTTP2_KEEP_ALIVE_INTERVAL)
+    } else {
+        builder.http1_only()
+    };
+    
+    let base_client = builder
         .build()
         .expect("Failed to create reqwest client");
 
@@ -55,6 +131,25 @@ fn create_client(config: ClientConfig) -> Arc<ClientWithMiddleware> {
     Arc::new(client)
 }
 
+/// Create a new blocking HTTP client for the sync transport
+pub fn create_blocking_client(config: &ClientConfig) -> PyResult<reqwest::blocking::Client> {
+    let mut builder = reqwest::blocking::Client::builder()
+        .timeout(config.timeout)
+        .pool_max_idle_per_host(config.pool_max_idle_per_host)
+        .pool_idle_timeout(config.pool_idle_timeout)
+        .user_agent(config.user_agent.clone());
+    
+    builder = if config.http2 {
+        builder.http2_adaptive_window(true)
+    } else {
+        builder.http1_only()
+    };
+    
+    builder
+        .build()
+        .map_err(|e| PyRuntimeError::new_err(format!("Failed to create client: {}", e)))
+}
+
 /// Initialize tracing subscriber for observability
 pub fn init_tracing() {
     use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt};
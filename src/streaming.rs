@@ -4,7 +4,7 @@ use bytes::Bytes;
 use futures::StreamExt;
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
-use tokio::sync::mpsc;
+use tokio::sync::{mpsc, OwnedSemaphorePermit};
 
 use crate::errors::TransportError;
 
@@ -15,13 +15,16 @@ pub struct ByteStream {
 }
 
 impl ByteStream {
-    /// Create a new ByteStream from a reqwest response body
-    pub fn from_response(response: reqwest::Response) -> Self {
+    /// Create a new ByteStream from a reqwest response body.
+    ///
+    /// The connection permit is held until the body is fully forwarded.
+    pub fn from_response(response: reqwest::Response, permit: OwnedSemaphorePermit) -> Self {
         let (tx, rx) = mpsc::channel(32);
         let mut stream = response.bytes_stream();
         
         // Spawn a task to forward the stream to the channel
         tokio::spawn(async move {
+            let _permit = permit;
             while let Some(result) = stream.next().await {
                 let bytes_result = result.map_err(TransportError::from);
                 if tx.send(bytes_result).await.is_err() {
@@ -136,22 +139,26 @@ impl SyncByteStream {
 
 /// Utility functions for handling Python request bodies
 pub fn extract_body_from_python(py_body: &PyAny) -> PyResult<reqwest::Body> {
+    Ok(reqwest::Body::from(extract_body_bytes(py_body)?))
+}
+
+/// Read a Python request body (bytes, string, or iterator of chunks) into memory
+pub fn extract_body_bytes(py_body: &PyAny) -> PyResult<Vec<u8>> {
     if py_body.is_none() {
-        return Ok(reqwest::Body::from(""));
+        return Ok(Vec::new());
     }
     
     // Try to extract as bytes first
     if let Ok(py_bytes) = py_body.downcast::<PyBytes>() {
-        let bytes = py_bytes.as_bytes();
-        return Ok(reqwest::Body::from(bytes.to_vec()));
+        return Ok(py_bytes.as_bytes().to_vec());
     }
     
     // Try to extract as string
     if let Ok(py_str) = py_body.extract::<String>() {
-        return Ok(reqwest::Body::from(py_str));
+        return Ok(py_str.into_bytes());
     }
     
-    // Try to extract as iterator
+    // Try to extract as iterator (e.g. httpcore's request stream)
     if let Ok(py_iter) = py_body.iter() {
         let mut body_data = Vec::new();
         for item in py_iter {
@@ -166,10 +173,10 @@ pub fn extract_body_from_python(py_body: &PyAny) -> PyResult<reqwest::Body> {
                 ));
             }
         }
-        return Ok(reqwest::Body::from(body_data));
+        return Ok(body_data);
     }
     
     Err(pyo3::exceptions::PyTypeError::new_err(
         "Body must be bytes, string, or iterator"
     ))
-} 
\ No newline at end of file
+}
@@ -1,42 +1,75 @@
 use std::sync::Arc;
 
+use once_cell::sync::OnceCell;
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 use reqwest_middleware::ClientWithMiddleware;
+use tokio::sync::Semaphore;
 
-use crate::client::get_client;
+use crate::client::{ClientConfig, create_blocking_client, get_client_for};
 use crate::errors::TransportError;
-use crate::streaming::{ByteStream, SyncByteStream, extract_body_from_python};
+use crate::streaming::{ByteStream, SyncByteStream, extract_body_bytes, extract_body_from_python};
 use crate::utils::{
-    extract_method, extract_url, extract_headers, extract_extensions,
+    extract_method, extract_url, extract_headers, extract_extensions, extract_request_body,
     create_response_object, extract_timeout_from_extensions, is_streaming_requested,
 };
 
-/// Async transport for httpx using Rust reqwest + tower
+/// Async transport for httpx using Rust reqwest + tower.
+///
+/// The HTTP client is created on the first request, so transports that are
+/// never used do not pay for client setup.
 #[pyclass]
 pub struct AsyncTransport {
-    client: Arc<ClientWithMiddleware>,
+    config: ClientConfig,
+    client: OnceCell<Arc<ClientWithMiddleware>>,
+    limiter: Arc<Semaphore>,
 }
 
-#[pymethods]
 impl AsyncTransport {
-    #[new]
-    fn new() -> Self {
-        // Initialize tracing on first use
-        crate::client::init_tracing();
-        
+    fn from_config(config: &ClientConfig) -> Self {
         Self {
-            client: get_client(),
+            config: config.clone(),
+            client: OnceCell::new(),
+            limiter: Arc::new(Semaphore::new(config.max_connections)),
         }
     }
     
+    /// Get the HTTP client, creating it on first use
+    fn client(&self) -> Arc<ClientWithMiddleware> {
+        self.client.get_or_init(|| {
+            // Initialize tracing on first use
+            crate::client::init_tracing();
+            
+            get_client_for(&self.config)
+        }).clone()
+    }
+}
+
+#[pymethods]
+impl AsyncTransport {
+    #[new]
+    #[pyo3(signature = (max_connections=100, max_keepalive_connections=20, keepalive_expiry=90.0, http2=true, timeout=None))]
+    fn new(
+        max_connections: usize,
+        max_keepalive_connections: usize,
+        keepalive_expiry: f64,
+        http2: bool,
+        timeout: Option<f64>,
+    ) -> PyResult<Self> {
+        let config = ClientConfig::from_options(
+            max_connections, max_keepalive_connections, keepalive_expiry, http2, timeout,
+        )?;
+        Ok(Self::from_config(&config))
+    }
+    
     /// Handle an async HTTP request
     fn handle_async_request<'py>(
         &self,
         py: Python<'py>,
         request: &PyAny,
     ) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
+        let client = self.client();
+        let limiter = self.limiter.clone();
         
         // Extract request components while holding GIL
         let method = extract_method(request.getattr("method")?)?;
@@ -45,10 +78,9 @@ impl AsyncTransport {
         let extensions = extract_extensions(request.getattr("extensions")?)?;
         
         // Extract body
-        let body = if let Ok(py_body) = request.getattr("content") {
-            extract_body_from_python(py_body)?
-        } else {
-            reqwest::Body::from("")
+        let body = match extract_request_body(request) {
+            Some(py_body) => extract_body_from_python(py_body)?,
+            None => reqwest::Body::from(""),
         };
         
         // Check configuration from extensions
@@ -57,6 +89,10 @@ impl AsyncTransport {
         
         // Release GIL and perform the request
         pyo3_asyncio::tokio::future_into_py(py, async move {
+            // Bound the number of in-flight requests to max_connections
+            let permit = limiter.acquire_owned().await
+                .map_err(|e| TransportError::PoolTimeout(e.to_string()))?;
+            
             let mut req_builder = client.request(method, url)
                 .headers(headers)
                 .body(body);
@@ -72,17 +108,19 @@ impl AsyncTransport {
             
             // Extract response components
             let status = response.status().as_u16();
+            let version = response.version();
             let response_headers = response.headers().clone();
             let response_extensions = Some(extensions.clone());
             
             if streaming {
                 // Create streaming response
-                let stream = ByteStream::from_response(response);
+                let stream = ByteStream::from_response(response, permit);
                 Python::with_gil(|py| {
                     let py_stream = Py::new(py, stream)?;
                     create_response_object(
                         py,
                         status,
+                        version,
                         response_headers,
                         None,  // No content for streaming
                         Some(py_stream.to_object(py)),
@@ -99,6 +137,7 @@ impl AsyncTransport {
                     create_response_object(
                         py,
                         status,
+                        version,
                         response_headers,
                         Some(py_content.into()),
                         None,  // No stream for non-streaming
@@ -121,28 +160,58 @@ impl AsyncTransport {
     }
 }
 
-/// Sync transport for httpx using Rust reqwest (blocking)
+/// Response body read by the sync transport while the GIL is released
+enum SyncBody {
+    Stream(SyncByteStream),
+    Full(bytes::Bytes),
+}
+
+/// Sync transport for httpx using Rust reqwest (blocking).
+///
+/// Network I/O runs with the GIL released. The blocking client (and its
+/// background runtime thread) is created on the first request.
 #[pyclass]
 pub struct SyncTransport {
-    client: reqwest::blocking::Client,
+    config: ClientConfig,
+    client: OnceCell<reqwest::blocking::Client>,
+    limiter: Arc<Semaphore>,
+}
+
+impl SyncTransport {
+    fn from_config(config: &ClientConfig) -> Self {
+        Self {
+            config: config.clone(),
+            client: OnceCell::new(),
+            limiter: Arc::new(Semaphore::new(config.max_connections)),
+        }
+    }
+    
+    /// Get the blocking HTTP client, creating it on first use
+    fn client(&self) -> PyResult<&reqwest::blocking::Client> {
+        self.client.get_or_try_init(|| {
+            // Initialize tracing on first use
+            crate::client::init_tracing();
+            
+            create_blocking_client(&self.config)
+        })
+    }
 }
 
 #[pymethods]
 impl SyncTransport {
     #[new]
-    fn new() -> PyResult<Self> {
-        // Initialize tracing on first use
-        crate::client::init_tracing();
-        
-        // Create a blocking client
-        let client = reqwest::blocking::Client::builder()
-            .pool_max_idle_per_host(64)
-            .user_agent(format!("rust-httpx-transport/{}", env!("CARGO_PKG_VERSION")))
-            .timeout(std::time::Duration::from_secs(30))
-            .build()
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to create client: {}", e)))?;
-        
-        Ok(Self { client })
+    #[pyo3(signature = (max_connections=100, max_keepalive_connections=20, keepalive_expiry=90.0, http2=true, timeout=None))]
+    fn new(
+        max_connections: usize,
+        max_keepalive_connections: usize,
+        keepalive_expiry: f64,
+        http2: bool,
+        timeout: Option<f64>,
+    ) -> PyResult<Self> {
+        let config = ClientConfig::from_options(
+            max_connections, max_keepalive_connections, keepalive_expiry, http2, timeout,
+        )?;
+        Ok(Self::from_config(&config))
     }
     
     /// Handle a sync HTTP request
@@ -158,21 +227,9 @@ impl SyncTransport {
         let extensions = extract_extensions(request.getattr("extensions")?)?;
         
         // Extract body - convert to bytes for sync client
-        let body_bytes: Vec<u8> = if let Ok(py_body) = request.getattr("content") {
-            // For sync transport, we need to extract the body as bytes
-            if py_body.is_none() {
-                Vec::new()
-            } else if let Ok(py_bytes) = py_body.downcast::<pyo3::types::PyBytes>() {
-                py_bytes.as_bytes().to_vec()
-            } else if let Ok(py_str) = py_body.extract::<String>() {
-                py_str.into_bytes()
-            } else {
-                return Err(pyo3::exceptions::PyTypeError::new_err(
-                    "Sync transport only supports bytes or string bodies"
-                ));
-            }
-        } else {
-            Vec::new()
+        let body_bytes: Vec<u8> = match extract_request_body(request) {
+            Some(py_body) => extract_body_bytes(py_body)?,
+            None => Vec::new(),
         };
         
         // Check configuration from extensions
@@ -180,7 +237,7 @@ impl SyncTransport {
         let streaming = is_streaming_requested(&extensions);
         
         // Build request
-        let mut req_builder = self.client.request(method, url)
+        let mut req_builder = self.client()?.request(method, url)
             .headers(headers)
             .body(body_bytes);
         
@@ -189,42 +246,62 @@ impl SyncTransport {
             req_builder = req_builder.timeout(timeout_duration);
         }
         
-        // Execute the request (this will block)
-        let response = req_builder.send()
-            .map_err(TransportError::from)?;
+        // Wait for a connection slot, execute the request and read the body
+        // without holding the GIL, so other Python threads keep running
+        let limiter = self.limiter.clone();
+        let (status, version, response_headers, body) = py.allow_threads(move || -> Result<_, TransportError> {
+            // Bound the number of in-flight requests to max_connections. As on
+            // the async path, the permit is held until the body is drained:
+            // SyncByteStream buffers the whole body before this closure returns.
+            let _permit = futures::executor::block_on(limiter.acquire_owned())
+                .map_err(|e| TransportError::PoolTimeout(e.to_string()))?;
+            
+            // Execute the request (this will block)
+            let response = req_builder.send()?;
+            
+            // Extract response components
+            let status = response.status().as_u16();
+            let version = response.version();
+            let response_headers = response.headers().clone();
+            
+            let body = if streaming {
+                SyncBody::Stream(SyncByteStream::from_response(response))
+            } else {
+                SyncBody::Full(response.bytes()?)
+            };
+            
+            Ok((status, version, response_headers, body))
+        })?;
         
-        // Extract response components
-        let status = response.status().as_u16();
-        let response_headers = response.headers().clone();
         let response_extensions = Some(extensions.clone());
         
-        if streaming {
-            // Create streaming response
-            let stream = SyncByteStream::from_response(response);
-            let py_stream = Py::new(py, stream)?;
-            
-            create_response_object(
-                py,
-                status,
-                response_headers,
-                None,  // No content for streaming
-                Some(py_stream.to_object(py)),
-                response_extensions,
-            )
-        } else {
-            // Read full response body
-            let bytes = response.bytes()
-                .map_err(TransportError::from)?;
-            
-            let py_content = PyBytes::new(py, &bytes);
-            create_response_object(
-                py,
-                status,
-                response_headers,
-                Some(py_content.into()),
-                None,  // No stream for non-streaming
-                response_extensions,
-            )
+        match body {
+            SyncBody::Stream(stream) => {
+                // Create streaming response
+                let py_stream = Py::new(py, stream)?;
+                
+                create_response_object(
+                    py,
+                    status,
+                    version,
+                    response_headers,
+                    None,  // No content for streaming
+                    Some(py_stream.to_object(py)),
+                    response_extensions,
+                )
+            }
+            SyncBody::Full(bytes) => {
+                let py_content = PyBytes::new(py, &bytes);
+                create_response_object(
+                    py,
+                    status,
+                    version,
+                    response_headers,
+                    Some(py_content.into()),
+                    None,  // No stream for non-streaming
+                    response_extensions,
+                )
+            }
         }
     }
     
@@ -237,12 +314,12 @@ impl SyncTransport {
 
 impl Default for AsyncTransport {
     fn default() -> Self {
-        Self::new()
+        Self::from_config(&ClientConfig::default())
     }
 }
 
 impl Default for SyncTransport {
     fn default() -> Self {
-        Self::new().expect("Failed to create SyncTransport")
+        Self::from_config(&ClientConfig::default())
     }
 } 
\ No newline at end of file
@@ -2,25 +2,77 @@ use std::collections::HashMap;
 use std::str::FromStr;
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyTuple};
+use pyo3::types::{PyBytes, PyDict, PyList, PyTuple};
 use reqwest::{Method, Url};
 
 
 
-/// Extract HTTP method from Python request
+/// Extract HTTP method from Python request (`str`, or `bytes` as httpcore uses)
 pub fn extract_method(py_method: &PyAny) -> PyResult<Method> {
-    let method_str: String = py_method.extract()?;
+    let method_str: String = if let Ok(py_bytes) = py_method.downcast::<PyBytes>() {
+        String::from_utf8_lossy(py_bytes.as_bytes()).into_owned()
+    } else {
+        py_method.extract()?
+    };
     Method::from_str(&method_str)
         .map_err(|_| pyo3::exceptions::PyValueError::new_err(format!("Invalid HTTP method: {}", method_str)))
 }
 
-/// Extract URL from Python request
+/// Extract URL from Python request (`str`, `bytes`, an `httpcore.URL` via its
+/// `__bytes__()`, or another URL object such as `httpx.URL` via its `str()`)
 pub fn extract_url(py_url: &PyAny) -> PyResult<Url> {
-    let url_str: String = py_url.extract()?;
+    let url_str: String = if let Ok(url_str) = py_url.extract::<String>() {
+        url_str
+    } else if let Some(url_bytes) = url_as_bytes(py_url) {
+        String::from_utf8(url_bytes)
+            .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid URL: {}", e)))?
+    } else {
+        py_url.str()?.extract()?
+    };
     Url::parse(&url_str)
         .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid URL: {}", e)))
 }
 
+/// Extract a header name or value given as either `str` or `bytes`
+fn extract_header_part(py_part: &PyAny) -> PyResult<Vec<u8>> {
+    if let Ok(py_bytes) = py_part.downcast::<PyBytes>() {
+        Ok(py_bytes.as_bytes().to_vec())
+    } else {
+        let part_str: String = py_part.extract()?;
+        Ok(part_str.into_bytes())
+    }
+}
+
+/// Append a single header pair, keeping repeated names intact
+fn append_header(headers: &mut reqwest::header::HeaderMap, key: &PyAny, value: &PyAny) -> PyResult<()> {
+    let header_name = reqwest::header::HeaderName::from_bytes(&extract_header_part(key)?)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header name: {}", e)))?;
+    let header_value = reqwest::header::HeaderValue::from_bytes(&extract_header_part(value)?)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header value: {}", e)))?;
+    
+    headers.append(header_name, header_value);
+    Ok(())
+}
+
+/// Get the bytes form of a URL given as `bytes` or an object defining `__bytes__`.
+///
+/// `httpcore.URL` has no `__str__`, so its `str()` is only the repr.
+fn url_as_bytes(py_url: &PyAny) -> Option<Vec<u8>> {
+    if let Ok(py_bytes) = py_url.downcast::<PyBytes>() {
+        return Some(py_bytes.as_bytes().to_vec());
+    }
+    let py_bytes = py_url.call_method0("__bytes__").ok()?;
+    py_bytes.downcast::<PyBytes>().ok().map(|b| b.as_bytes().to_vec())
+}
+
+/// Get the request body object: `content` on httpx requests, `stream` on
+/// httpcore requests (which have no `content` attribute)
+pub fn extract_request_body(request: &PyAny) -> Option<&PyAny> {
+    request.getattr("content")
+        .or_else(|_| request.getattr("stream"))
+        .ok()
+}
+
 /// Extract headers from Python request
 pub fn extract_headers(py_headers: &PyAny) -> PyResult<reqwest::header::HeaderMap> {
     let mut headers = reqwest::header::HeaderMap::new();
@@ -32,34 +84,25 @@ pub fn extract_headers(py_headers: &PyAny) -> PyResult<reqwest::header::HeaderMa
     // Handle different header formats
     if let Ok(py_dict) = py_headers.downcast::<PyDict>() {
         for (key, value) in py_dict {
-            let key_str: String = key.extract()?;
-            let value_str: String = value.extract()?;
-            
-            let header_name = reqwest::header::HeaderName::from_str(&key_str)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header name: {}", e)))?;
-            let header_value = reqwest::header::HeaderValue::from_str(&value_str)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header value: {}", e)))?;
-            
-            headers.insert(header_name, header_value);
+            append_header(&mut headers, key, value)?;
         }
-    } else if let Ok(py_list) = py_headers.downcast::<PyList>() {
-        // Handle list of tuples format: [("name", "value"), ...]
-        for item in py_list {
-            let tuple: &PyTuple = item.downcast()?;
-            if tuple.len() != 2 {
-                return Err(pyo3::exceptions::PyValueError::new_err("Header tuples must have exactly 2 elements"));
-            }
-            
-            let key_str: String = tuple.get_item(0)?.extract()?;
-            let value_str: String = tuple.get_item(1)?.extract()?;
-            
-            let header_name = reqwest::header::HeaderName::from_str(&key_str)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header name: {}", e)))?;
-            let header_value = reqwest::header::HeaderValue::from_str(&value_str)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid header value: {}", e)))?;
-            
-            headers.insert(header_name, header_value);
+        return Ok(headers);
+    }
+    
+    // httpx.Headers exposes the raw (bytes, bytes) pairs, preserving duplicates
+    let py_pairs = match py_headers.getattr("raw") {
+        Ok(raw) => raw,
+        Err(_) => py_headers,
+    };
+    
+    // Handle sequence of pairs format: [("name", "value"), (b"name", b"value"), ...]
+    for item in py_pairs.iter()? {
+        let item = item?;
+        if item.len()? != 2 {
+            return Err(pyo3::exceptions::PyValueError::new_err("Header tuples must have exactly 2 elements"));
         }
+        
+        append_header(&mut headers, item.get_item(0)?, item.get_item(1)?)?;
     }
     
     Ok(headers)
@@ -125,6 +168,7 @@ pub fn extract_extensions(py_extensions: &PyAny) -> PyResult<HashMap<String, ser
 pub fn create_response_object(
     py: Python,
     status: u16,
+    version: reqwest::Version,
     headers: reqwest::header::HeaderMap,
     content: Option<PyObject>,
     stream: Option<PyObject>,
@@ -150,8 +194,8 @@ pub fn create_response_object(
         kwargs.set_item("stream", stream)?;
     }
     
+    let py_extensions = PyDict::new(py);
     if let Some(ext) = extensions {
-        let py_extensions = PyDict::new(py);
         for (key, value) in ext {
             let py_value = match value {
                 serde_json::Value::Null => py.None(),
@@ -170,14 +214,28 @@ pub fn create_response_object(
             };
             py_extensions.set_item(key, py_value)?;
         }
-        kwargs.set_item("extensions", py_extensions)?;
     }
     
+    // httpx reads the negotiated protocol from the "http_version" extension
+    py_extensions.set_item("http_version", PyBytes::new(py, http_version_bytes(version)))?;
+    kwargs.set_item("extensions", py_extensions)?;
+    
     // Create and return response object
     let response = response_class.call((), Some(kwargs))?;
     Ok(response.to_object(py))
 }
 
+/// Convert a negotiated HTTP version to the bytes httpcore uses
+fn http_version_bytes(version: reqwest::Version) -> &'static [u8] {
+    match version {
+        reqwest::Version::HTTP_09 => b"HTTP/0.9",
+        reqwest::Version::HTTP_10 => b"HTTP/1.0",
+        reqwest::Version::HTTP_2 => b"HTTP/2",
+        reqwest::Version::HTTP_3 => b"HTTP/3",
+        _ => b"HTTP/1.1",
+    }
+}
+
 /// Extract timeout configuration from extensions
 pub fn extract_timeout_from_extensions(extensions: &HashMap<String, serde_json::Value>) -> Option<std::time::Duration> {
     if let Some(timeout_value) = extensions.get("timeout") {
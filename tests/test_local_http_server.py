@@ -1,4 +1,5 @@
 import http.server
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 
 import pytest
@@ -9,6 +10,12 @@ try:
 except ImportError:
     HTTPCORE_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 try:
     import rust_httpx
     RUST_AVAILABLE = rust_httpx.is_available()
@@ -20,7 +27,17 @@ class HelloHandler(http.server.BaseHTTPRequestHandler):
         self.send_response(200)
         self.send_header("Content-Type", "text/plain")
         self.end_headers()
-        self.wfile.write(b"hello from server")
+        if self.path == "/echo-header":
+            self.wfile.write(", ".join(self.headers.get_all("X-Test", [])).encode())
+        else:
+            self.wfile.write(b"hello from server")
+
+    def do_POST(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, *args, **kwargs):
         # Silence logging
@@ -28,7 +45,8 @@ class HelloHandler(http.server.BaseHTTPRequestHandler):
 
 @pytest.fixture
 def http_server():
-    server = http.server.HTTPServer(("127.0.0.1", 0), HelloHandler)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), HelloHandler)
+    server.daemon_threads = True
     port = server.server_address[1]
     thread = Thread(target=server.serve_forever, daemon=True)
     thread.start()
@@ -46,6 +64,7 @@ async def test_async_rust_transport_against_local_server(http_server):
     request = httpcore.Request("GET", http_server)
     response = await transport.handle_async_request(request)
     assert response.status == 200
+    assert response.extensions["http_version"] == b"HTTP/1.1"
     assert await response.aread() == b"hello from server"
     await transport.aclose()
 
@@ -59,3 +78,113 @@ def test_sync_rust_transport_against_local_server(http_server):
     assert response.status == 200
     assert response.read() == b"hello from server"
     transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+@pytest.mark.asyncio
+async def test_async_rust_transport_sends_request_headers(http_server):
+    transport = rust_httpx.AsyncTransport()
+    request = httpcore.Request("GET", f"{http_server}/echo-header", headers=[(b"X-Test", b"preserved")])
+    response = await transport.handle_async_request(request)
+    assert response.status == 200
+    assert await response.aread() == b"preserved"
+    await transport.aclose()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+def test_sync_rust_transport_sends_request_headers(http_server):
+    transport = rust_httpx.SyncTransport()
+    request = httpcore.Request("GET", f"{http_server}/echo-header", headers=[(b"X-Test", b"preserved")])
+    response = transport.handle_request(request)
+    assert response.status == 200
+    assert response.read() == b"preserved"
+    transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not available")
+def test_sync_rust_transport_sends_repeated_httpx_headers(http_server):
+    transport = rust_httpx.SyncTransport()
+    request = httpx.Request("GET", f"{http_server}/echo-header", headers=[("X-Test", "first"), ("X-Test", "second")])
+    response = transport.handle_request(request)
+    assert response.status_code == 200
+    assert response.read() == b"first, second"
+    transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+def test_sync_rust_transport_with_pool_limits(http_server):
+    transport = rust_httpx.SyncTransport(
+        max_connections=1, max_keepalive_connections=1, keepalive_expiry=5.0, http2=False, timeout=10.0
+    )
+    for _ in range(3):
+        response = transport.handle_request(httpcore.Request("GET", http_server))
+        assert response.status == 200
+        assert response.read() == b"hello from server"
+    transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+def test_sync_rust_transport_shared_across_threads(http_server):
+    transport = rust_httpx.SyncTransport()
+
+    def fetch(_):
+        response = transport.handle_request(httpcore.Request("GET", http_server))
+        return response.status, response.read()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(fetch, range(8)))
+
+    assert results == [(200, b"hello from server")] * 8
+    transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not available")
+@pytest.mark.parametrize(
+    "make_request",
+    [
+        lambda url: httpcore.Request("GET", httpcore.URL(url)),
+        lambda url: httpx.Request("GET", httpx.URL(url)),
+    ],
+    ids=["httpcore.URL", "httpx.URL"],
+)
+def test_sync_rust_transport_accepts_url_objects(http_server, make_request):
+    transport = rust_httpx.SyncTransport()
+    request = make_request(http_server)
+    response = transport.handle_request(request)
+    # httpx requests get httpx responses back, httpcore requests httpcore ones
+    if isinstance(request, httpx.Request):
+        assert response.status_code == 200
+    else:
+        assert response.status == 200
+    assert response.read() == b"hello from server"
+    transport.close()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+@pytest.mark.asyncio
+async def test_async_rust_transport_sends_httpcore_request_body(http_server):
+    transport = rust_httpx.AsyncTransport()
+    request = httpcore.Request("POST", http_server, content=b"request body")
+    response = await transport.handle_async_request(request)
+    assert response.status == 200
+    assert await response.aread() == b"request body"
+    await transport.aclose()
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+@pytest.mark.skipif(not HTTPCORE_AVAILABLE, reason="httpcore not available")
+def test_sync_rust_transport_sends_httpcore_request_body(http_server):
+    transport = rust_httpx.SyncTransport()
+    request = httpcore.Request("POST", http_server, content=b"request body")
+    response = transport.handle_request(request)
+    assert response.status == 200
+    assert response.read() == b"request body"
+    transport.close()
@@ -51,6 +51,17 @@ class TestAsyncTransport:
             assert response.status_code == 200
             assert "httpbin.org" in response.text
     
+    @pytest.mark.asyncio
+    async def test_http2_negotiated(self):
+        """Test that HTTP/2 is negotiated via ALPN by default."""
+        transport = rust_httpx.AsyncTransport()
+        
+        request = httpcore.Request("GET", "https://httpbin.org/get")
+        response = await transport.handle_async_request(request)
+        assert response.status == 200
+        assert response.extensions["http_version"] == b"HTTP/2"
+        await transport.aclose()
+    
     @pytest.mark.asyncio
     async def test_post_request_with_json(self):
         """Test a POST request with JSON data."""
@@ -157,6 +168,7 @@ class TestUtilities:
     def test_is_available(self):
         """Test the is_available function."""
         assert rust_httpx.is_available() is True
+        assert rust_httpx.IS_AVAILABLE is True
     
     def test_get_version_info(self):
         """Test the get_version_info function."""
@@ -167,6 +179,119 @@ class TestUtilities:
         assert "python_version" in info
         assert info["rust_available"] is True
         assert info["import_error"] is None
+    
+    def test_get_version_info_returns_copy(self):
+        """Test that callers cannot mutate the cached version info."""
+        info = rust_httpx.get_version_info()
+        info["version"] = "mutated"
+        
+        assert rust_httpx.get_version_info()["version"] == rust_httpx.__version__
+
+
+@pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+class TestPoolOptions:
+    """Test validation of the connection-pool constructor options."""
+    
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"max_connections": 0},
+            {"max_connections": 2**62},
+            {"keepalive_expiry": -1.0},
+            {"timeout": -1.0},
+        ],
+    )
+    def test_transport_rejects_invalid_pool_options(self, options):
+        """Test that out-of-range options raise instead of panicking."""
+        # Values too large for the platform's usize raise OverflowError while converting
+        with pytest.raises((ValueError, OverflowError)):
+            rust_httpx.AsyncTransport(**options)
+        with pytest.raises((ValueError, OverflowError)):
+            rust_httpx.SyncTransport(**options)
+
+
+def _with_inner(transport_cls, inner):
+    """Build a wrapper transport around a stand-in for the Rust transport."""
+    transport = object.__new__(transport_cls)
+    transport._transport = inner
+    return transport
+
+
+def _fake_core_response():
+    return httpcore.Response(
+        200,
+        headers=[(b"Content-Type", b"text/plain")],
+        content=b"hello",
+        extensions={"http_version": b"HTTP/2"},
+    )
+
+
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not available")
+class TestHttpxResponses:
+    """Test that httpx clients receive httpx responses from the wrappers."""
+    
+    def test_sync_client(self):
+        """Test that httpx.Client accepts the sync transport's responses."""
+        inner = Mock()
+        inner.handle_request.return_value = _fake_core_response()
+        
+        with httpx.Client(transport=_with_inner(rust_httpx.SyncTransport, inner)) as client:
+            response = client.get("http://example.test/")
+        
+        assert response.status_code == 200
+        assert response.text == "hello"
+        assert response.http_version == "HTTP/2"
+    
+    @pytest.mark.asyncio
+    async def test_async_client(self):
+        """Test that httpx.AsyncClient accepts the async transport's responses."""
+        class Inner:
+            async def handle_async_request(self, request):
+                return _fake_core_response()
+            
+            async def aclose(self):
+                pass
+        
+        inner = Inner()
+        
+        async with httpx.AsyncClient(transport=_with_inner(rust_httpx.AsyncTransport, inner)) as client:
+            response = await client.get("http://example.test/")
+        
+        assert response.status_code == 200
+        assert response.text == "hello"
+        assert response.http_version == "HTTP/2"
+    
+    def test_httpcore_requests_get_httpcore_responses(self):
+        """Test that direct httpcore callers still get httpcore responses."""
+        inner = Mock()
+        inner.handle_request.return_value = _fake_core_response()
+        
+        transport = _with_inner(rust_httpx.SyncTransport, inner)
+        response = transport.handle_request(httpcore.Request("GET", "http://example.test/"))
+        
+        assert isinstance(response, httpcore.Response)
+
+
+class TestPublicAPI:
+    """Test the public surface of the Python wrapper."""
+    
+    def test_transports_support_context_managers(self):
+        """Test that both transports implement the context manager protocol."""
+        assert hasattr(rust_httpx.AsyncTransport, "__aenter__")
+        assert hasattr(rust_httpx.AsyncTransport, "__aexit__")
+        assert hasattr(rust_httpx.SyncTransport, "__enter__")
+        assert hasattr(rust_httpx.SyncTransport, "__exit__")
+    
+    def test_transports_use_slots(self):
+        """Test that transport instances carry no per-instance __dict__."""
+        assert "__dict__" not in vars(rust_httpx.AsyncTransport)
+        assert "__dict__" not in vars(rust_httpx.SyncTransport)
+    
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust transport not available")
+    def test_transport_instances_have_no_dict(self):
+        """Test that constructed transports have no __dict__."""
+        for transport in (rust_httpx.AsyncTransport(), rust_httpx.SyncTransport()):
+            assert not hasattr(transport, "__dict__")
 
 
 class TestFallbackBehavior: